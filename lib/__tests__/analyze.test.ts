@@ -17,6 +17,13 @@ describe("analyze", () => {
     expect(skills[0]).not.toHaveProperty("coverage");
   });
 
+  it("drops prereqs that don't reference an output skill", () => {
+    const withDangling = AnalyzeSchema.parse({
+      skills: [{ id: "x", name: "X", category: "C", weight: 3, prereqs: ["x_missing"], coverage: 0.5 }],
+    });
+    expect(splitCoverage(withDangling).skills[0].prereqs).toEqual([]);
+  });
+
   it("rejects an out-of-range weight", () => {
     expect(() => AnalyzeSchema.parse({ skills: [{ id: "x", name: "X", category: "C", weight: 9, coverage: 0.5 }] })).toThrow();
   });
@@ -0,0 +1,27 @@
+import { describe, it, expect } from "vitest";
+import { extractSkillCoverage, normalize } from "../extract";
+import type { Skill } from "../types";
+
+const mk = (id: string, name: string, keywords: string[]): Skill => ({
+  id, name, category: "Core", weight: 3, keywords, prereqs: [], assessment: [], resources: [],
+});
+
+describe("extractSkillCoverage", () => {
+  it("scores more distinct keyword hits higher, floors the rest at 0.05", () => {
+    const skills = [mk("py", "Python", ["python", "pandas"]), mk("go", "Go", ["golang"])];
+    const cov = extractSkillCoverage(skills, "Built ETL in Python with pandas and Airflow.");
+    expect(cov.py).toBeGreaterThan(0.5); // python + pandas + name = 2 distinct phrases (name dedupes with keyword)
+    expect(cov.go).toBe(0.05);
+  });
+
+  it("matches multi-word phrases on word boundaries only", () => {
+    const skills = [mk("java", "Java", ["java"]), mk("ml", "Machine Learning", ["machine learning"])];
+    const cov = extractSkillCoverage(skills, "JavaScript dev exploring machine learning basics");
+    expect(cov.java).toBe(0.05); // "javascript" must not count as "java"
+    expect(cov.ml).toBe(0.35);
+  });
+
+  it("normalizes case and punctuation but keeps '+'", () => {
+    expect(normalize("C++, and  SQL!")).toBe("c++ and sql");
+  });
+});
@@ -32,11 +32,29 @@ export const AnalyzeSchema = z.object({
 });
 export type AnalyzeParsed = z.infer<typeof AnalyzeSchema>;
 
+const CRED_ORDER: Record<string, number> = { "interview-safe": 0, "good-intuition": 1, misleading: 2 };
+
 // pure + tested: drop per-skill coverage out of the Skill shape into its own map
 export function splitCoverage(parsed: AnalyzeParsed): { skills: Skill[]; coverage: Record<string, number> } {
-  const skills: Skill[] = parsed.skills.map(({ coverage, ...s }) => s);
+  // One pass builds both outputs. Resources are ordered credible-first here, at
+  // load time — every downstream reader (planner picks, any resource list UI)
+  // then sees them pre-ranked.
+  const ids = new Set(parsed.skills.map((s) => s.id));
+  const skills: Skill[] = [];
   const coverage: Record<string, number> = {};
-  for (const s of parsed.skills) coverage[s.id] = s.coverage;
+  for (const { coverage: c, ...s } of parsed.skills) {
+    skills.push({
+      ...s,
+      // The prompt tells the model prereqs may only reference output ids, but
+      // models drift — drop dangling references here so scoring and the planner
+      // never see phantom prereqs.
+      prereqs: s.prereqs.filter((p) => ids.has(p)),
+      resources: [...s.resources].sort(
+        (a, b) => (CRED_ORDER[a.credibility] ?? 9) - (CRED_ORDER[b.credibility] ?? 9),
+      ),
+    });
+    coverage[s.id] = c;
+  }
   return { skills, coverage };
 }
 
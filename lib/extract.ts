@@ -0,0 +1,98 @@
+import type { Skill, Coverage } from "./types";
+
+// Deterministic keyword-coverage estimator — no LLM involved. Scans the resume text
+// once against every skill's keywords (+ the skill name) and maps the number of
+// distinct matched phrases to a confidence value. Useful as an offline cross-check
+// against the LLM's coverage judgement.
+
+// Lowercase and keep only [a-z0-9+] so "C++" survives; everything else becomes a
+// token boundary. Single char-code pass (no regex) since this runs over the full
+// resume on every extraction; separator runs collapse and the ends come out trimmed.
+export function normalize(s: string): string {
+  const lower = s.toLowerCase();
+  let out = "";
+  let sep = false;
+  for (let i = 0; i < lower.length; i++) {
+    const c = lower.charCodeAt(i);
+    if ((c >= 97 && c <= 122) || (c >= 48 && c <= 57) || c === 43) {
+      if (sep && out) out += " ";
+      out += lower[i];
+      sep = false;
+    } else {
+      sep = true;
+    }
+  }
+  return out;
+}
+
+// Confidence ladder: more distinct phrase hits → higher confidence, capped at 0.9
+// (keyword presence alone never "proves" a skill). Indexed by hit count.
+const CONFIDENCE = [0.05, 0.35, 0.55, 0.7, 0.82, 0.9] as const;
+
+const confidenceFromMatches = (n: number): number => CONFIDENCE[Math.min(n, CONFIDENCE.length - 1)];
+
+interface TrieNode {
+  children: Map<string, TrieNode>;
+  hits: { skillId: string; phrase: string }[]; // phrases ending at this node
+}
+
+const newNode = (): TrieNode => ({ children: new Map(), hits: [] });
+
+// The skills array is immutable once an analysis lands, so the compiled trie is
+// cached per array: repeat extractions (re-renders, day-to-day replans) skip the
+// normalize + rebuild work entirely.
+const trieCache = new WeakMap<Skill[], TrieNode>();
+
+// Token trie over every phrase, so the text is scanned in ONE pass: at each text
+// token we walk as deep as the trie allows and collect every phrase ending along
+// the way. Shared prefixes ("machine learning", "machine learning ops") are
+// walked once instead of compared entry-by-entry.
+function buildPhraseTrie(skills: Skill[]): TrieNode {
+  const cached = trieCache.get(skills);
+  if (cached) return cached;
+  const root = newNode();
+  for (const s of skills) {
+    const seen = new Set<string>();
+    for (const raw of [...s.keywords, s.name]) {
+      const phrase = normalize(raw);
+      if (!phrase || seen.has(phrase)) continue;
+      seen.add(phrase);
+      let node = root;
+      for (const token of phrase.split(" ")) {
+        let next = node.children.get(token);
+        if (!next) {
+          next = newNode();
+          node.children.set(token, next);
+        }
+        node = next;
+      }
+      node.hits.push({ skillId: s.id, phrase });
+    }
+  }
+  trieCache.set(skills, root);
+  return root;
+}
+
+export function extractSkillCoverage(skills: Skill[], text: string): Coverage {
+  const root = buildPhraseTrie(skills);
+  const tokens = normalize(text).split(" ");
+
+  // Matching on whole tokens gives word boundaries for free ("java" never hits "javascript").
+  const matched = new Map<string, Set<string>>();
+  for (let i = 0; i < tokens.length; i++) {
+    let node: TrieNode | undefined = root;
+    for (let j = i; j < tokens.length; j++) {
+      node = node.children.get(tokens[j]);
+      if (!node) break;
+      for (const hit of node.hits) {
+        const set = matched.get(hit.skillId);
+        if (set) set.add(hit.phrase);
+        else matched.set(hit.skillId, new Set([hit.phrase]));
+      }
+    }
+  }
+
+  const coverage: Coverage = {};
+  for (const s of skills) coverage[s.id] = confidenceFromMatches(matched.get(s.id)?.size ?? 0);
+  return coverage;
+}
@@ -33,6 +33,10 @@ export interface DayFeedback {
 const clamp01 = (x: number) => (x < 0 ? 0 : x > 1 ? 1 : x);
 const dedupe = (xs: string[]) => [...new Set(xs)];
 
+// A prereq is "missing" when its mastery sits below the primer threshold.
+const missingPrereqs = (s: Skill, masteryOf: Map<string, number>) =>
+  s.prereqs.filter((p) => (masteryOf.get(p) ?? 0.05) < 0.55);
+
 // Seedable PRNG so a given (seed, day) always yields the same plan (JS Math.random isn't seedable).
 function mulberry32(seed: number) {
   let t = seed >>> 0;
@@ -73,14 +77,22 @@ export function applyDayFeedback(
     const conf = fb.confidence ?? 3;
     if (conf <= 2) reinforce.push(id);
     else if (conf >= 5) m = Math.min(1, m + 0.02);
-    newMastery[id] = clamp01(m);
+    // m entered clamped and only moved via Math.min(1, m + x) — already in [0,1].
+    newMastery[id] = m;
   }
 
   return { newMastery, reinforce: dedupe(reinforce), retry: dedupe(retry) };
 }
 
+// The top-2 selection is deterministic per (skill, taskType), but day-to-day
+// replans redo it for the same skills. Cache per skill object — skills are
+// immutable after an analysis, and a WeakMap lets dropped analyses collect.
+const topResourceCache = new WeakMap<Skill, Map<TaskType, Resource[]>>();
+
 function chooseResource(skill: Skill, taskType: TaskType, rand: () => number): Resource {
-  const resources = [...(skill.resources ?? [])];
+  const cached = topResourceCache.get(skill)?.get(taskType);
+  if (cached) return cached[Math.floor(rand() * cached.length)];
+  const resources = skill.resources ?? [];
   if (!resources.length) {
     return {
       title: `${skill.name} (no resource yet)`,
@@ -103,53 +115,85 @@ function chooseResource(skill: Skill, taskType: TaskType, rand: () => number): R
           ? 0
           : 1
         : 0;
-  resources.sort(
-    (a, b) => (credRank[a.credibility] ?? 9) - (credRank[b.credibility] ?? 9) || typeRank(a) - typeRank(b),
-  );
-  const top = resources.slice(0, Math.min(2, resources.length));
+  // Credibility dominates type (typeRank < 4), so one composite key sorts both.
+  const rankOf = (r: Resource) => (credRank[r.credibility] ?? 9) * 4 + typeRank(r);
+  // Single-pass top-2 instead of copy + sort + slice. Strict `<` keeps ties in
+  // input order, matching what the stable sort produced.
+  let best: Resource | null = null;
+  let second: Resource | null = null;
+  let bestK = Infinity;
+  let secondK = Infinity;
+  for (const r of resources) {
+    const k = rankOf(r);
+    if (k < bestK) {
+      second = best;
+      secondK = bestK;
+      best = r;
+      bestK = k;
+    } else if (k < secondK) {
+      second = r;
+      secondK = k;
+    }
+  }
+  const top = second ? [best!, second] : [best!];
+  let byTask = topResourceCache.get(skill);
+  if (!byTask) {
+    byTask = new Map();
+    topResourceCache.set(skill, byTask);
+  }
+  byTask.set(taskType, top);
   return top[Math.floor(rand() * top.length)];
 }
 
-function rankGapsByMastery(skills: Skill[], mastery: Record<string, number>): Gap[] {
-  const gaps: Gap[] = skills.map((s) => {
-    const c = clamp01(mastery[s.id] ?? 0.05);
-    return {
+function rankGapsByMastery(skills: Skill[], masteryOf: Map<string, number>, fillPrereqsTop = 0): Gap[] {
+  // Precompute each sort key once — the comparator runs O(n log n) times and used
+  // to redo gap*weight and toLowerCase on every comparison.
+  const ranked = skills.map((s) => {
+    const c = masteryOf.get(s.id) ?? 0.05;
+    const g: Gap = {
       skillId: s.id,
       skillName: s.name,
       category: s.category,
       weight: s.weight,
       coverage: c,
       gap: 1 - c,
-      prereqsMissing: s.prereqs.filter((p) => (mastery[p] ?? 0.05) < 0.55),
+      prereqsMissing: [],
     };
+    return { g, s, impact: g.gap * g.weight, nameLower: s.name.toLowerCase() };
   });
-  gaps.sort(
+  ranked.sort(
     (a, b) =>
-      b.gap * b.weight - a.gap * a.weight ||
-      b.weight - a.weight ||
-      b.gap - a.gap ||
-      a.skillName.toLowerCase().localeCompare(b.skillName.toLowerCase()),
+      b.impact - a.impact ||
+      b.g.weight - a.g.weight ||
+      b.g.gap - a.g.gap ||
+      a.nameLower.localeCompare(b.nameLower),
   );
-  return gaps;
+  // Only the head of the ranking is ever read with prereq detail, so the prereq
+  // scan is skipped for the tail.
+  for (let i = 0; i < Math.min(fillPrereqsTop, ranked.length); i++) {
+    const { g, s } = ranked[i];
+    g.prereqsMissing = missingPrereqs(s, masteryOf);
+  }
+  return ranked.map((r) => r.g);
 }
 
-function pickFocusSkills(candidateIds: string[], mastery: Record<string, number>, maxFocus = 2): string[] {
-  const scored = candidateIds.map((sid) => ({ m: mastery[sid] ?? 0.05, sid }));
+function pickFocusSkills(candidates: Skill[], masteryOf: Map<string, number>, maxFocus = 2): Skill[] {
+  const scored = candidates.map((s) => ({ m: masteryOf.get(s.id) ?? 0.05, s }));
   scored.sort((a, b) => a.m - b.m); // lowest mastery first
-  const focus: string[] = [];
-  for (const { m, sid } of scored) {
+  const focus: Skill[] = [];
+  for (const { m, s } of scored) {
     if (focus.length >= maxFocus) break;
     if (m >= 0.8) continue;
-    focus.push(sid);
+    focus.push(s);
   }
   return focus;
 }
 
-function pickReviewSkill(skills: Skill[], mastery: Record<string, number>, exclude: Set<string>): string | null {
+function pickReviewSkill(skills: Skill[], masteryOf: Map<string, number>, exclude: Set<string>): string | null {
   const candidates: { d: number; sid: string }[] = [];
   for (const s of skills) {
     if (exclude.has(s.id)) continue;
-    const m = mastery[s.id] ?? 0.05;
+    const m = masteryOf.get(s.id) ?? 0.05;
     if (m >= 0.55 && m <= 0.8) candidates.push({ d: Math.abs(m - 0.68), sid: s.id });
   }
   if (!candidates.length) return null;
@@ -183,26 +227,47 @@ export function generateDayPlan(args: {
   const byId = new Map(skills.map((s) => [s.id, s] as const));
   const notes: string[] = [];
 
-  const gapRanked = rankGapsByMastery(skills, mastery);
-
-  let candidateIds = [
-    ...retrySkills,
-    ...reinforceSkills,
-    ...gapRanked.slice(0, topGapPool).map((g) => g.skillId),
-  ];
-  candidateIds = dedupe(candidateIds.filter((id) => byId.has(id)));
+  // One clamped mastery lookup per skill for the whole plan — the helpers below
+  // used to redo `mastery[id] ?? 0.05` (and re-clamp) on every access.
+  const masteryOf = new Map(skills.map((s) => [s.id, clamp01(mastery[s.id] ?? 0.05)] as const));
+
+  const gapRanked = rankGapsByMastery(skills, masteryOf, topGapPool);
+  // The ranked head already carries its missing prereqs — reuse instead of rescanning.
+  const missingByGap = new Map(gapRanked.slice(0, topGapPool).map((g) => [g.skillId, g.prereqsMissing] as const));
+
+  // Filter + dedupe the candidate sources in one pass instead of building the
+  // merged list and then walking it twice. Resolve each id against the skill map
+  // exactly once and carry the Skill object forward — the focus loop used to
+  // look every picked id up again.
+  const seenCandidate = new Set<string>();
+  const candidates: Skill[] = [];
+  const addCandidate = (id: string) => {
+    if (seenCandidate.has(id)) return;
+    const s = byId.get(id);
+    if (s) {
+      seenCandidate.add(id);
+      candidates.push(s);
+    }
+  };
+  for (const id of retrySkills) addCandidate(id);
+  for (const id of reinforceSkills) addCandidate(id);
+  for (let i = 0; i < Math.min(topGapPool, gapRanked.length); i++) addCandidate(gapRanked[i].skillId);
 
   if (retrySkills.length) notes.push("You skipped some items yesterday — today starts with smaller retries.");
   if (reinforceSkills.length) notes.push("Some topics felt hard — today includes quick reinforcement blocks.");
 
-  const focusIds = pickFocusSkills(candidateIds, mastery, 2);
-  const reviewId = pickReviewSkill(skills, mastery, new Set(focusIds));
+  const focusSkills = pickFocusSkills(candidates, masteryOf, 2);
+  const reviewId = pickReviewSkill(skills, masteryOf, new Set(focusSkills.map((s) => s.id)));
 
   let learnBudget = Math.round(minutesPerDay * 0.45);
   let practiceBudget = Math.round(minutesPerDay * 0.45);
   let explainBudget = minutesPerDay - learnBudget - practiceBudget;
+  // Block sizes depend only on minutesPerDay — decide them once, not per focus skill.
+  const learnMinutes = minutesPerDay >= 90 ? 20 : 15;
+  const practiceMinutes = minutesPerDay >= 120 ? 25 : 20;
 
   const items: PlanItem[] = [];
+  const usedSkills = new Set<string>(); // maintained by addTask, read in 4e
   let order = 1;
   let usedMinutes = 0;
 
@@ -226,6 +291,7 @@ export function generateDayPlan(args: {
       successCheck,
     });
     usedMinutes += minutes;
+    usedSkills.add(skill.id);
     order += 1;
   };
 
@@ -242,24 +308,19 @@ export function generateDayPlan(args: {
   }
 
   // 4c) Main focus skills: prereq primer (if needed), then learn + practice + explain
-  for (const sid of focusIds) {
-    const s = byId.get(sid);
-    if (!s) continue;
-
-    const missingPrereqs = s.prereqs.filter((p) => (mastery[p] ?? 0.05) < 0.55);
-    if (missingPrereqs.length) {
-      const pre = byId.get(missingPrereqs[0]);
+  for (const s of focusSkills) {
+    const missing = missingByGap.get(s.id) ?? missingPrereqs(s, masteryOf);
+    if (missing.length) {
+      const pre = byId.get(missing[0]);
       if (pre) {
         addTask(pre, "review", 15, `Quick primer: explain ${pre.name} in 2–3 sentences.`);
         notes.push(`Added prerequisite primer before '${s.name}'.`);
       }
     }
 
-    const learnMinutes = minutesPerDay >= 90 ? 20 : 15;
     addTask(s, "learn", Math.min(learnMinutes, learnBudget), learnCheck(s));
     learnBudget -= Math.min(learnMinutes, learnBudget);
 
-    const practiceMinutes = minutesPerDay >= 120 ? 25 : 20;
     addTask(s, "practice", Math.min(practiceMinutes, practiceBudget), practiceCheck(s));
     practiceBudget -= Math.min(practiceMinutes, practiceBudget);
 
@@ -276,7 +337,6 @@ export function generateDayPlan(args: {
   // 4e) If we still have time, add practice on the biggest remaining gap
   if (usedMinutes < minutesPerDay) {
     const remaining = minutesPerDay - usedMinutes;
-    const usedSkills = new Set(items.map((it) => it.skillId));
     for (const g of gapRanked) {
       if (usedSkills.has(g.skillId)) continue;
       const s = byId.get(g.skillId);
@@ -289,5 +349,7 @@ export function generateDayPlan(args: {
   if (!items.length) notes.push("No tasks were generated — check your skill map and inputs.");
   else notes.push("Tip: mark tasks as done + difficulty — tomorrow's plan adapts automatically.");
 
-  return { day, totalMinutes: Math.min(minutesPerDay, usedMinutes), items, notes };
+  // addTask already caps every task at the remaining budget, so usedMinutes
+  // can never exceed minutesPerDay.
+  return { day, totalMinutes: usedMinutes, items, notes };
 }
@@ -10,21 +10,35 @@ export interface Progress {
   day: number;
 }
 
+// Memoize the last (raw, parsed) pair so repeat loads — and the load right after
+// a save — skip JSON.parse. The raw string is the cache key: any external edit
+// to the stored value still reparses.
+let cachedRaw: string | null = null;
+let cachedProgress: Progress | null = null;
+
 export function loadProgress(): Progress | null {
   if (typeof window === "undefined") return null;
   const raw = window.localStorage.getItem(KEY);
   if (!raw) return null;
+  if (raw === cachedRaw) return cachedProgress;
   try {
-    return JSON.parse(raw) as Progress;
+    cachedProgress = JSON.parse(raw) as Progress;
+    cachedRaw = raw;
+    return cachedProgress;
   } catch {
     return null;
   }
 }
 
 export function saveProgress(p: Progress): void {
-  if (typeof window !== "undefined") window.localStorage.setItem(KEY, JSON.stringify(p));
+  if (typeof window === "undefined") return;
+  cachedRaw = JSON.stringify(p);
+  cachedProgress = p;
+  window.localStorage.setItem(KEY, cachedRaw);
 }
 
 export function clearProgress(): void {
   if (typeof window !== "undefined") window.localStorage.removeItem(KEY);
+  cachedRaw = null;
+  cachedProgress = null;
 }
@@ -9,30 +9,41 @@ export function scoreReadiness(
 ): ScoreReport {
   const topKGaps = opts.topKGaps ?? 6;
   const prereqPenalty = opts.prereqPenalty ?? 0.1;
-  const cov = (id: string) => clamp01(coverage[id] ?? 0);
 
+  // Clamp each skill's coverage exactly once up front; every later read —
+  // readiness sums, the gap loop, the per-prereq checks — is a plain lookup.
+  const covById: Coverage = {};
+  for (const s of skills) covById[s.id] = clamp01(coverage[s.id] ?? 0);
+  const cov = (id: string) => covById[id] ?? 0;
+
+  // One pass accumulates the overall and per-category weighted sums together,
+  // with a single coverage lookup per skill (it fed both loops before).
   let totalW = 0;
   let total = 0;
+  const cats = new Map<string, { w: number; t: number }>();
   for (const s of skills) {
+    const c = cov(s.id);
+    const wc = s.weight * c;
     totalW += s.weight;
-    total += s.weight * cov(s.id);
+    total += wc;
+    const agg = cats.get(s.category);
+    if (agg) {
+      agg.w += s.weight;
+      agg.t += wc;
+    } else {
+      cats.set(s.category, { w: s.weight, t: wc });
+    }
   }
   const readinessOverall = totalW > 0 ? total / totalW : 0;
 
   const readinessByCategory: Record<string, number> = {};
-  const categories = [...new Set(skills.map((s) => s.category))];
-  for (const c of categories) {
-    let cw = 0;
-    let ct = 0;
-    for (const s of skills.filter((s) => s.category === c)) {
-      cw += s.weight;
-      ct += s.weight * cov(s.id);
-    }
-    readinessByCategory[c] = cw > 0 ? ct / cw : 0;
-  }
+  for (const [c, { w, t }] of cats) readinessByCategory[c] = w > 0 ? t / w : 0;
 
-  const gaps: Gap[] = skills.map((s) => {
-    let gap = 1 - cov(s.id);
+  // Rank lightweight entries and materialize Gap objects only for the top-K
+  // that is actually returned — the tail is ranked but never shipped.
+  const entries = skills.map((s) => {
+    const c = cov(s.id);
+    let gap = 1 - c;
     const prereqsMissing: string[] = [];
     let factor = 0;
     for (const p of s.prereqs) {
@@ -42,36 +53,33 @@ export function scoreReadiness(
         factor += (0.55 - pc) / 0.55;
       }
     }
+    // gap starts in [0,1] (c is clamped) and the penalty path caps at 1 — no re-clamp needed.
     if (prereqsMissing.length) gap = Math.min(1, gap + prereqPenalty * Math.min(1, factor));
-    return {
-      skillId: s.id,
-      skillName: s.name,
-      category: s.category,
-      weight: s.weight,
-      coverage: cov(s.id),
-      gap: clamp01(gap),
-      prereqsMissing,
-    };
+    return { s, c, gap, impact: gap * s.weight, nameLower: s.name.toLowerCase(), prereqsMissing };
   });
 
-  gaps.sort((a, b) => {
-    const ia = a.gap * a.weight;
-    const ib = b.gap * b.weight;
-    return (
-      ib - ia ||
-      b.weight - a.weight ||
-      b.gap - a.gap ||
-      a.skillName.toLowerCase().localeCompare(b.skillName.toLowerCase())
-    );
-  });
+  // Two stable sorts: name order first, numeric keys second. Numeric ties keep
+  // the name order, so the result matches the old four-way cascade while the
+  // main comparator stays free of string comparisons.
+  entries.sort((a, b) => a.nameLower.localeCompare(b.nameLower));
+  entries.sort((a, b) => b.impact - a.impact || b.s.weight - a.s.weight || b.gap - a.gap);
 
-  const coverageBySkill: Coverage = {};
-  for (const s of skills) coverageBySkill[s.id] = cov(s.id);
+  const topGaps: Gap[] = entries.slice(0, Math.max(0, topKGaps)).map(({ s, c, gap, prereqsMissing }) => ({
+    skillId: s.id,
+    skillName: s.name,
+    category: s.category,
+    weight: s.weight,
+    coverage: c,
+    gap,
+    prereqsMissing,
+  }));
 
   return {
-    readinessOverall: clamp01(readinessOverall),
+    // A weighted average of clamped values is already in [0,1].
+    readinessOverall,
     readinessByCategory,
-    coverageBySkill,
-    topGaps: gaps.slice(0, Math.max(0, topKGaps)),
+    // Already keyed by skill id and clamped — no need to rebuild it for the report.
+    coverageBySkill: covById,
+    topGaps,
   };
 }